@@ -10,6 +10,12 @@ from .ucp import (
     ucp_checkout_session,
     ucp_apply_discount,
     ucp_complete_checkout,
+    ucp_async,
+    ucp_discover_async,
+    ucp_checkout_session_async,
+    ucp_apply_discount_async,
+    ucp_complete_checkout_async,
+    ucp_reload_config,
 )
 
 __version__ = "0.1.0"
@@ -19,4 +25,10 @@ __all__ = [
     "ucp_checkout_session",
     "ucp_apply_discount",
     "ucp_complete_checkout",
+    "ucp_async",
+    "ucp_discover_async",
+    "ucp_checkout_session_async",
+    "ucp_apply_discount_async",
+    "ucp_complete_checkout_async",
+    "ucp_reload_config",
 ]
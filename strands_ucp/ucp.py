@@ -8,13 +8,395 @@ Supports discovery, checkout, orders, and all UCP capabilities.
 Licensed under the Apache License, Version 2.0
 """
 
+import asyncio
+import atexit
+import copy
 import os
-import uuid
+import re
+import time
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
 import httpx
 from strands import tool
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode()
+
+    _json_loads = json.loads
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # HTTP/2 needs the httpx[http2] extra
+    _HTTP2 = False
+
+
+# Shared HTTP clients, keyed by (timeout, follow_redirects), so repeat calls
+# to the same merchant reuse pooled connections instead of re-handshaking.
+# With h2 installed they negotiate HTTP/2 via ALPN and multiplex concurrent
+# requests to the same host over one connection.
+_CLIENTS: Dict[Tuple[int, bool], httpx.Client] = {}
+_CLIENT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+# Async clients are bound to the event loop that created them, so they are kept
+# per loop and closed by a watcher task when that loop shuts down.
+_ASYNC_CLIENTS: Dict[
+    asyncio.AbstractEventLoop, Dict[Tuple[int, bool], httpx.AsyncClient]
+] = {}
+_ASYNC_CLIENT_WATCHERS: Set["asyncio.Task[None]"] = set()
+
+_UCP_AGENT = 'profile="https://strands.dev/profile"'
+_DISCOVERY_ENDPOINT = "/.well-known/ucp"
+_DISCOVERY_TIMEOUT = 30
+
+# Errors from sending a request that are reported as error results rather than
+# raised: transport failures, plus malformed URLs and header values from callers.
+_REQUEST_ERRORS = (httpx.RequestError, httpx.InvalidURL, UnicodeEncodeError)
+
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Action -> (method, endpoint) or (method, endpoint with {id}, endpoint without id).
+# The {id} is the checkout_id for checkout actions and the order_id otherwise.
+_ACTION_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "discovery": ("GET", _DISCOVERY_ENDPOINT),
+    "checkout_create": ("POST", "/checkout-sessions"),
+    "checkout_get": ("GET", "/checkout-sessions/{id}", "/checkout-sessions"),
+    "checkout_update": ("PUT", "/checkout-sessions/{id}", "/checkout-sessions"),
+    "checkout_complete": (
+        "POST",
+        "/checkout-sessions/{id}/complete",
+        "/checkout-sessions/complete",
+    ),
+    "order_get": ("GET", "/orders/{id}", "/orders"),
+    "order_list": ("GET", "/orders"),
+    "order_cancel": ("POST", "/orders/{id}/cancel", "/orders/cancel"),
+    "order_update": ("PUT", "/orders/{id}", "/orders"),
+    "refund_create": ("POST", "/orders/{id}/refunds", "/orders/refunds"),
+    "return_create": ("POST", "/orders/{id}/returns", "/orders/returns"),
+    "dispute_create": ("POST", "/orders/{id}/disputes", "/orders/disputes"),
+}
+_VALID_ACTIONS_TUPLE = tuple(_ACTION_TEMPLATES) + ("custom",)
+_VALID_ACTIONS_SET = frozenset(_VALID_ACTIONS_TUPLE)
+
+# Successful discovery results by merchant URL, as (expires_at, result). Results
+# are deep-copied in and out so callers cannot mutate the cached data.
+# Entries live for the response's Cache-Control max-age, else UCP_DISCOVERY_TTL;
+# a UCP_DISCOVERY_TTL of 0 or less disables the cache entirely.
+_DISCOVERY_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_DEFAULT_DISCOVERY_TTL = 300.0
+
+
+def _discovery_ttl_from_env() -> float:
+    """Read UCP_DISCOVERY_TTL, falling back to the default when it is malformed."""
+    try:
+        return float(os.getenv("UCP_DISCOVERY_TTL", _DEFAULT_DISCOVERY_TTL))
+    except ValueError:
+        return _DEFAULT_DISCOVERY_TTL
+
+
+_DISCOVERY_TTL = _discovery_ttl_from_env()
+
+# Environment-derived defaults, read once at import; see ucp_reload_config().
+_DEFAULT_SIGNATURE = os.getenv("UCP_REQUEST_SIGNATURE")
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def _get_client(timeout: int, follow_redirects: bool) -> httpx.Client:
+    """Return the shared client for the given settings, creating it on first use."""
+    key = (timeout, follow_redirects)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            limits=_CLIENT_LIMITS,
+            http2=_HTTP2,
+        )
+        _CLIENTS[key] = client
+    return client
+
+
+def _get_async_client(timeout: int, follow_redirects: bool) -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    clients = _ASYNC_CLIENTS.get(loop)
+    if clients is None:
+        # Forget clients of loops that were closed without shutting down cleanly
+        for stale in [other for other in _ASYNC_CLIENTS if other.is_closed()]:
+            del _ASYNC_CLIENTS[stale]
+        clients = _ASYNC_CLIENTS[loop] = {}
+        watcher = loop.create_task(_close_async_clients_on_shutdown(loop))
+        _ASYNC_CLIENT_WATCHERS.add(watcher)
+        watcher.add_done_callback(_ASYNC_CLIENT_WATCHERS.discard)
+
+    key = (timeout, follow_redirects)
+    client = clients.get(key)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            limits=_CLIENT_LIMITS,
+            http2=_HTTP2,
+        )
+        clients[key] = client
+    return client
+
+
+async def _close_async_clients_on_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Wait until the loop cancels pending tasks, then close its async clients."""
+    try:
+        await loop.create_future()
+    finally:
+        for client in _ASYNC_CLIENTS.pop(loop, {}).values():
+            await client.aclose()
+
+
+def ucp_reload_config() -> None:
+    """
+    Re-read UCP_REQUEST_SIGNATURE and UCP_DISCOVERY_TTL from the environment.
+
+    Both are read once at import; call this after changing them at runtime.
+    """
+    global _DEFAULT_SIGNATURE, _DISCOVERY_TTL
+    _DEFAULT_SIGNATURE = os.getenv("UCP_REQUEST_SIGNATURE")
+    _DISCOVERY_TTL = _discovery_ttl_from_env()
+
+
+def _fast_uuid4() -> str:
+    """Return a random version 4 UUID string without building a uuid.UUID."""
+    b = os.urandom(16)
+    return (
+        f"{b[:4].hex()}-{b[4:6].hex()}-4{b[6:7].hex()[1:]}{b[7:8].hex()}-"
+        f"{b[8] & 0x3F | 0x80:02x}{b[9:10].hex()}-{b[10:].hex()}"
+    )
+
+
+def _discovery_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached discovery result if it has not expired."""
+    entry = _DISCOVERY_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        _DISCOVERY_CACHE.pop(key, None)
+        return None
+    return copy.deepcopy(entry[1])
+
+
+def _discovery_cache_put(key: str, result: Dict[str, Any]) -> None:
+    """Cache a successful discovery result, honoring Cache-Control."""
+    if _DISCOVERY_TTL <= 0 or result.get("status") != "success":
+        return
+
+    ttl = _DISCOVERY_TTL
+    cache_control = result.get("headers", {}).get("cache-control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        ttl = float(match.group(1))
+
+    if ttl > 0:
+        _DISCOVERY_CACHE[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+
+
+def _discovery_headers() -> Dict[str, str]:
+    """Build the minimal header set for a discovery GET."""
+    headers = {"UCP-Agent": _UCP_AGENT, "request-id": _fast_uuid4()}
+    if _DEFAULT_SIGNATURE:
+        headers["request-signature"] = _DEFAULT_SIGNATURE
+    return headers
+
+
+def _request_error(e: Exception, timeout: int) -> Dict[str, Any]:
+    """Convert a transport or bad-input error into an error result dict."""
+    if isinstance(e, httpx.TimeoutException):
+        return {
+            "status": "error",
+            "message": f"Request timeout: {str(e)}",
+            "timeout": timeout,
+        }
+    return {
+        "status": "error",
+        "message": f"Request error: {str(e)}",
+    }
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close all shared clients at interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
+
+    for loop, clients in list(_ASYNC_CLIENTS.items()):
+        if not loop.is_closed() and not loop.is_running():
+            for client in clients.values():
+                loop.run_until_complete(client.aclose())
+    _ASYNC_CLIENTS.clear()
+
+
+def _build_request(
+    action: str,
+    merchant_url: str,
+    method: str,
+    endpoint: str,
+    headers: Optional[Dict[str, str]],
+    body: Optional[Dict[str, Any]],
+    checkout_id: Optional[str],
+    order_id: Optional[str],
+    request_signature: Optional[str],
+    auto_headers: bool,
+) -> Union[Tuple[str, str, Dict[str, str]], Dict[str, Any]]:
+    """
+    Resolve a UCP action into the HTTP request to send.
+
+    Returns:
+        (method, url, headers) on success, or an error result dict if the
+        action or method is not supported.
+    """
+    if action not in _VALID_ACTIONS_SET:
+        return {
+            "status": "error",
+            "message": f"Unknown action: {action}. Use 'custom' for manual requests.",
+            "valid_actions": _VALID_ACTIONS_TUPLE,
+        }
+
+    # Determine method and endpoint
+    if action == "custom":
+        final_method = method
+        final_endpoint = endpoint
+    else:
+        template = _ACTION_TEMPLATES[action]
+        final_method = template[0]
+        final_endpoint = template[1]
+        if len(template) == 3:
+            resource_id = checkout_id if action.startswith("checkout") else order_id
+            if resource_id:
+                final_endpoint = template[1].format(id=resource_id)
+            else:
+                final_endpoint = template[2]
+
+    if final_method not in _VALID_METHODS:
+        return {
+            "status": "error",
+            "message": f"Unsupported HTTP method: {final_method}",
+        }
+
+    # Build full URL
+    url = f"{merchant_url.rstrip('/')}{final_endpoint}"
+
+    # Prepare headers
+    request_headers = headers or {}
+
+    # Add UCP-required headers automatically
+    if auto_headers:
+        if "UCP-Agent" not in request_headers:
+            request_headers["UCP-Agent"] = _UCP_AGENT
+        if "request-id" not in request_headers:
+            request_headers["request-id"] = _fast_uuid4()
+        if "idempotency-key" not in request_headers and final_method in _BODY_METHODS:
+            request_headers["idempotency-key"] = _fast_uuid4()
+
+        # Add request signature if provided (parameter or env var)
+        if "request-signature" not in request_headers:
+            signature = request_signature or _DEFAULT_SIGNATURE
+            if signature:
+                request_headers["request-signature"] = signature
+            # Note: If no signature provided, header is omitted (required for production UCP)
+
+    # Add Content-Type for requests with body
+    if body is not None and "Content-Type" not in request_headers:
+        request_headers["Content-Type"] = "application/json"
+
+    return final_method, url, request_headers
+
+
+def _build_result(
+    action: str,
+    response: httpx.Response,
+    method: str,
+    url: str,
+    request_headers: Dict[str, str],
+    body: Optional[Dict[str, Any]],
+    include_request_echo: bool,
+) -> Dict[str, Any]:
+    """Parse a merchant response into the tool result dict."""
+    # Parse response, only attempting JSON when the merchant declares it
+    if not response.content:
+        response_body = None
+    elif "json" in response.headers.get("content-type", "").lower():
+        try:
+            response_body = _json_loads(response.content)
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError on bad bytes
+            response_body = response.text
+    else:
+        response_body = response.text
+
+    # Extract UCP metadata and IDs in a single pass
+    ucp_metadata = None
+    capabilities = []
+    response_checkout_id = None
+    response_order_id = None
+
+    if isinstance(response_body, dict):
+        ucp_metadata = response_body.get("ucp")
+        if isinstance(ucp_metadata, dict):
+            capabilities = ucp_metadata.get("capabilities", [])
+
+        response_id = response_body.get("id")
+        order = response_body.get("order")
+        if action.startswith("checkout"):
+            response_checkout_id = response_id
+        elif action.startswith("order"):
+            response_order_id = response_id
+
+        # For order in checkout response
+        if isinstance(order, dict):
+            response_order_id = order.get("id") or response_order_id
+
+    # Build result
+    result = {
+        "status": "success" if response.is_success else "error",
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "body": response_body,
+    }
+
+    if include_request_echo:
+        result["request"] = {
+            "method": method,
+            "url": url,
+            "headers": {
+                k: v for k, v in request_headers.items() if k != "request-signature"
+            },  # Don't log signature
+            "body": body,
+        }
+
+    # Add extracted metadata
+    if ucp_metadata:
+        result["ucp_metadata"] = ucp_metadata
+    if capabilities:
+        result["capabilities"] = capabilities
+    if response_checkout_id:
+        result["checkout_id"] = response_checkout_id
+    if response_order_id:
+        result["order_id"] = response_order_id
+
+    return result
+
 
 @tool
 def ucp(
@@ -30,6 +412,7 @@ def ucp(
     auto_headers: bool = True,
     timeout: int = 30,
     follow_redirects: bool = True,
+    include_request_echo: bool = False,
 ) -> Dict[str, Any]:
     """
     Universal Commerce Protocol (UCP) client tool.
@@ -63,6 +446,7 @@ def ucp(
         auto_headers: Automatically add UCP-required headers (default: True)
         timeout: Request timeout in seconds
         follow_redirects: Follow HTTP redirects
+        include_request_echo: Include the sent request (minus signature) in the result
 
     Returns:
         Dict with:
@@ -74,6 +458,7 @@ def ucp(
             - capabilities: List of capabilities if discovery response
             - checkout_id: Checkout ID if checkout response
             - order_id: Order ID if order response
+            - request: Sent method, URL, headers and body if include_request_echo=True
 
     Examples:
         # Discover merchant capabilities
@@ -129,221 +514,194 @@ def ucp(
         )
     """
 
+    request = _build_request(
+        action,
+        merchant_url,
+        method,
+        endpoint,
+        headers,
+        body,
+        checkout_id,
+        order_id,
+        request_signature,
+        auto_headers,
+    )
+    if isinstance(request, dict):
+        return request
+    final_method, url, request_headers = request
+
+    content = (
+        _json_dumps(body)
+        if body is not None and final_method in _BODY_METHODS
+        else None
+    )
+    client = _get_client(timeout, follow_redirects)
+
+    # Make the request; only transport failures become error results
     try:
-        # Action-to-endpoint mapping
-        action_map = {
-            "discovery": {
-                "method": "GET",
-                "endpoint": "/.well-known/ucp",
-            },
-            "checkout_create": {
-                "method": "POST",
-                "endpoint": "/checkout-sessions",
-            },
-            "checkout_get": {
-                "method": "GET",
-                "endpoint": (
-                    f"/checkout-sessions/{checkout_id}"
-                    if checkout_id
-                    else "/checkout-sessions"
-                ),
-            },
-            "checkout_update": {
-                "method": "PUT",
-                "endpoint": (
-                    f"/checkout-sessions/{checkout_id}"
-                    if checkout_id
-                    else "/checkout-sessions"
-                ),
-            },
-            "checkout_complete": {
-                "method": "POST",
-                "endpoint": (
-                    f"/checkout-sessions/{checkout_id}/complete"
-                    if checkout_id
-                    else "/checkout-sessions/complete"
-                ),
-            },
-            "order_get": {
-                "method": "GET",
-                "endpoint": f"/orders/{order_id}" if order_id else "/orders",
-            },
-            "order_list": {
-                "method": "GET",
-                "endpoint": "/orders",
-            },
-            "order_cancel": {
-                "method": "POST",
-                "endpoint": (
-                    f"/orders/{order_id}/cancel" if order_id else "/orders/cancel"
-                ),
-            },
-            "order_update": {
-                "method": "PUT",
-                "endpoint": f"/orders/{order_id}" if order_id else "/orders",
-            },
-            "refund_create": {
-                "method": "POST",
-                "endpoint": (
-                    f"/orders/{order_id}/refunds" if order_id else "/orders/refunds"
-                ),
-            },
-            "return_create": {
-                "method": "POST",
-                "endpoint": (
-                    f"/orders/{order_id}/returns" if order_id else "/orders/returns"
-                ),
-            },
-            "dispute_create": {
-                "method": "POST",
-                "endpoint": (
-                    f"/orders/{order_id}/disputes" if order_id else "/orders/disputes"
-                ),
-            },
-        }
+        response = client.request(
+            final_method, url, headers=request_headers, content=content
+        )
+    except _REQUEST_ERRORS as e:
+        return _request_error(e, timeout)
+
+    return _build_result(
+        action,
+        response,
+        final_method,
+        url,
+        request_headers,
+        body,
+        include_request_echo,
+    )
 
-        # Determine method and endpoint
-        if action == "custom":
-            final_method = method
-            final_endpoint = endpoint
-        elif action in action_map:
-            final_method = action_map[action]["method"]
-            final_endpoint = action_map[action]["endpoint"]
-        else:
-            return {
-                "status": "error",
-                "message": f"Unknown action: {action}. Use 'custom' for manual requests.",
-                "valid_actions": list(action_map.keys()) + ["custom"],
-            }
 
-        # Build full URL
-        url = f"{merchant_url.rstrip('/')}{final_endpoint}"
-
-        # Prepare headers
-        request_headers = headers or {}
-
-        # Add UCP-required headers automatically
-        if auto_headers:
-            if "UCP-Agent" not in request_headers:
-                request_headers["UCP-Agent"] = 'profile="https://strands.dev/profile"'
-            if "request-id" not in request_headers:
-                request_headers["request-id"] = str(uuid.uuid4())
-            if "idempotency-key" not in request_headers and final_method in [
-                "POST",
-                "PUT",
-                "PATCH",
-            ]:
-                request_headers["idempotency-key"] = str(uuid.uuid4())
-
-            # Add request signature if provided (parameter or env var)
-            if "request-signature" not in request_headers:
-                signature = request_signature or os.getenv("UCP_REQUEST_SIGNATURE")
-                if signature:
-                    request_headers["request-signature"] = signature
-                # Note: If no signature provided, header is omitted (required for production UCP)
-
-        # Add Content-Type for requests with body
-        if body and "Content-Type" not in request_headers:
-            request_headers["Content-Type"] = "application/json"
-
-        # Make the request
-        with httpx.Client(timeout=timeout, follow_redirects=follow_redirects) as client:
-            if final_method == "GET":
-                response = client.get(url, headers=request_headers)
-            elif final_method == "POST":
-                response = client.post(url, json=body, headers=request_headers)
-            elif final_method == "PUT":
-                response = client.put(url, json=body, headers=request_headers)
-            elif final_method == "PATCH":
-                response = client.patch(url, json=body, headers=request_headers)
-            elif final_method == "DELETE":
-                response = client.delete(url, headers=request_headers)
-            else:
-                return {
-                    "status": "error",
-                    "message": f"Unsupported HTTP method: {final_method}",
-                }
+@tool
+async def ucp_async(
+    action: str,
+    merchant_url: str,
+    method: str = "GET",
+    endpoint: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[Dict[str, Any]] = None,
+    checkout_id: Optional[str] = None,
+    order_id: Optional[str] = None,
+    request_signature: Optional[str] = None,
+    auto_headers: bool = True,
+    timeout: int = 30,
+    follow_redirects: bool = True,
+    include_request_echo: bool = False,
+) -> Dict[str, Any]:
+    """
+    Async Universal Commerce Protocol (UCP) client tool.
 
-        # Parse response
-        try:
-            response_body = response.json()
-        except json.JSONDecodeError:
-            response_body = response.text
+    Same actions, arguments and result format as `ucp`, but the request runs on a
+    shared httpx.AsyncClient so many merchant calls can be awaited concurrently.
 
-        # Extract UCP metadata
-        ucp_metadata = None
-        capabilities = []
-        response_checkout_id = None
-        response_order_id = None
-
-        if isinstance(response_body, dict):
-            # Extract UCP metadata from response
-            if "ucp" in response_body:
-                ucp_metadata = response_body["ucp"]
-                if "capabilities" in ucp_metadata:
-                    capabilities = ucp_metadata["capabilities"]
-
-            # Extract IDs
-            if "id" in response_body:
-                if action.startswith("checkout"):
-                    response_checkout_id = response_body["id"]
-                elif action.startswith("order"):
-                    response_order_id = response_body["id"]
-
-            # For order in checkout response
-            if "order" in response_body and isinstance(response_body["order"], dict):
-                if "id" in response_body["order"]:
-                    response_order_id = response_body["order"]["id"]
-
-        # Build result
-        result = {
-            "status": "success" if response.is_success else "error",
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": response_body,
-            "request": {
-                "method": final_method,
-                "url": url,
-                "headers": {
-                    k: v for k, v in request_headers.items() if k != "request-signature"
-                },  # Don't log signature
-                "body": body,
-            },
-        }
+    Args:
+        action: UCP action to perform (see `ucp` for the full list, or "custom")
+        merchant_url: Base URL of the UCP merchant (e.g., "https://shop.example.com")
+        method: HTTP method (GET, POST, PUT, PATCH, DELETE) - auto-set for standard actions
+        endpoint: Custom endpoint path (for "custom" action)
+        headers: Additional HTTP headers (UCP headers added automatically if auto_headers=True)
+        body: Request body as dict (will be JSON-encoded)
+        checkout_id: Checkout session ID (for checkout operations)
+        order_id: Order ID (for order operations)
+        request_signature: Request signature (JWT/signed token). Falls back to UCP_REQUEST_SIGNATURE env var.
+        auto_headers: Automatically add UCP-required headers (default: True)
+        timeout: Request timeout in seconds
+        follow_redirects: Follow HTTP redirects
+        include_request_echo: Include the sent request (minus signature) in the result
 
-        # Add extracted metadata
-        if ucp_metadata:
-            result["ucp_metadata"] = ucp_metadata
-        if capabilities:
-            result["capabilities"] = capabilities
-        if response_checkout_id:
-            result["checkout_id"] = response_checkout_id
-        if response_order_id:
-            result["order_id"] = response_order_id
+    Returns:
+        Dict with the same fields as `ucp`
 
-        return result
+    Example:
+        results = await asyncio.gather(
+            ucp_async(action="discovery", merchant_url="https://shop-a.example.com"),
+            ucp_async(action="discovery", merchant_url="https://shop-b.example.com"),
+        )
+    """
 
-    except httpx.TimeoutException as e:
-        return {
-            "status": "error",
-            "message": f"Request timeout: {str(e)}",
-            "timeout": timeout,
-        }
-    except httpx.RequestError as e:
-        return {
-            "status": "error",
-            "message": f"Request error: {str(e)}",
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": f"Unexpected error: {str(e)}",
-        }
+    request = _build_request(
+        action,
+        merchant_url,
+        method,
+        endpoint,
+        headers,
+        body,
+        checkout_id,
+        order_id,
+        request_signature,
+        auto_headers,
+    )
+    if isinstance(request, dict):
+        return request
+    final_method, url, request_headers = request
+
+    content = (
+        _json_dumps(body)
+        if body is not None and final_method in _BODY_METHODS
+        else None
+    )
+    client = _get_async_client(timeout, follow_redirects)
+
+    # Make the request; only transport failures become error results
+    try:
+        response = await client.request(
+            final_method, url, headers=request_headers, content=content
+        )
+    except _REQUEST_ERRORS as e:
+        return _request_error(e, timeout)
+
+    return _build_result(
+        action,
+        response,
+        final_method,
+        url,
+        request_headers,
+        body,
+        include_request_echo,
+    )
 
 
 # Helper functions for common UCP operations
 
 
+def _checkout_session_body(
+    line_items: List[Dict[str, Any]],
+    currency: str,
+    payment_handlers: List[Dict[str, Any]],
+    buyer: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the checkout_create payload."""
+    body = {
+        "line_items": line_items,
+        "currency": currency,
+        "payment": {
+            "instruments": [],
+            "handlers": payment_handlers,
+        },
+    }
+
+    if buyer:
+        body["buyer"] = buyer
+
+    return body
+
+
+def _apply_discount_body(
+    checkout_id: str,
+    discount_codes: List[str],
+    current_checkout: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the checkout_update payload that applies discount codes."""
+    return {
+        "id": checkout_id,
+        "line_items": current_checkout.get("line_items", []),
+        "currency": current_checkout.get("currency", "USD"),
+        "payment": current_checkout.get("payment", {}),
+        "discounts": {
+            "codes": discount_codes,
+        },
+    }
+
+
+def _complete_checkout_body(
+    payment_instrument: Dict[str, Any],
+    risk_signals: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the checkout_complete payload."""
+    body = {
+        "payment_data": payment_instrument,
+    }
+
+    if risk_signals:
+        body["risk_signals"] = risk_signals
+
+    return body
+
+
 @tool
 def ucp_discover(merchant_url: str) -> Dict[str, Any]:
     """
@@ -356,6 +714,10 @@ def ucp_discover(merchant_url: str) -> Dict[str, Any]:
     - Payment handlers
     - Transport bindings (REST, MCP, A2A)
 
+    Successful responses are cached per merchant for the Cache-Control max-age,
+    or UCP_DISCOVERY_TTL seconds (default 300) when the merchant sends none.
+    Setting UCP_DISCOVERY_TTL=0 disables the cache.
+
     Args:
         merchant_url: Base URL of the UCP merchant
 
@@ -365,7 +727,22 @@ def ucp_discover(merchant_url: str) -> Dict[str, Any]:
     Example:
         ucp_discover(merchant_url="https://shop.example.com")
     """
-    return ucp(action="discovery", merchant_url=merchant_url)
+    key = merchant_url.rstrip("/")
+    cached = _discovery_cache_get(key)
+    if cached is not None:
+        return cached
+
+    # Fast path: discovery is a plain GET, so skip ucp()'s generic dispatch
+    url = key + _DISCOVERY_ENDPOINT
+    headers = _discovery_headers()
+    try:
+        response = _get_client(_DISCOVERY_TIMEOUT, True).get(url, headers=headers)
+    except _REQUEST_ERRORS as e:
+        return _request_error(e, _DISCOVERY_TIMEOUT)
+
+    result = _build_result("discovery", response, "GET", url, headers, None, False)
+    _discovery_cache_put(key, result)
+    return result
 
 
 @tool
@@ -401,17 +778,7 @@ def ucp_checkout_session(
             request_signature="eyJhbGc..."
         )
     """
-    body = {
-        "line_items": line_items,
-        "currency": currency,
-        "payment": {
-            "instruments": [],
-            "handlers": payment_handlers,
-        },
-    }
-
-    if buyer:
-        body["buyer"] = buyer
+    body = _checkout_session_body(line_items, currency, payment_handlers, buyer)
 
     return ucp(
         action="checkout_create",
@@ -451,16 +818,7 @@ def ucp_apply_discount(
             request_signature="eyJhbGc..."
         )
     """
-    # Build update payload with discount
-    body = {
-        "id": checkout_id,
-        "line_items": current_checkout.get("line_items", []),
-        "currency": current_checkout.get("currency", "USD"),
-        "payment": current_checkout.get("payment", {}),
-        "discounts": {
-            "codes": discount_codes,
-        },
-    }
+    body = _apply_discount_body(checkout_id, discount_codes, current_checkout)
 
     return ucp(
         action="checkout_update",
@@ -504,12 +862,7 @@ def ucp_complete_checkout(
             request_signature="eyJhbGc..."
         )
     """
-    body = {
-        "payment_data": payment_instrument,
-    }
-
-    if risk_signals:
-        body["risk_signals"] = risk_signals
+    body = _complete_checkout_body(payment_instrument, risk_signals)
 
     return ucp(
         action="checkout_complete",
@@ -520,6 +873,141 @@ def ucp_complete_checkout(
     )
 
 
+# Async helper functions, for running many merchant calls concurrently
+
+
+@tool
+async def ucp_discover_async(merchant_url: str) -> Dict[str, Any]:
+    """
+    Discover UCP merchant capabilities (async).
+
+    Args:
+        merchant_url: Base URL of the UCP merchant
+
+    Returns:
+        Dict with discovery data including services, capabilities, and payment handlers
+
+    Example:
+        await asyncio.gather(
+            ucp_discover_async("https://shop-a.example.com"),
+            ucp_discover_async("https://shop-b.example.com"),
+        )
+    """
+    key = merchant_url.rstrip("/")
+    cached = _discovery_cache_get(key)
+    if cached is not None:
+        return cached
+
+    url = key + _DISCOVERY_ENDPOINT
+    headers = _discovery_headers()
+    try:
+        client = _get_async_client(_DISCOVERY_TIMEOUT, True)
+        response = await client.get(url, headers=headers)
+    except _REQUEST_ERRORS as e:
+        return _request_error(e, _DISCOVERY_TIMEOUT)
+
+    result = _build_result("discovery", response, "GET", url, headers, None, False)
+    _discovery_cache_put(key, result)
+    return result
+
+
+@tool
+async def ucp_checkout_session_async(
+    merchant_url: str,
+    line_items: List[Dict[str, Any]],
+    currency: str,
+    payment_handlers: List[Dict[str, Any]],
+    buyer: Optional[Dict[str, Any]] = None,
+    request_signature: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create a new UCP checkout session (async).
+
+    Args:
+        merchant_url: Base URL of the UCP merchant
+        line_items: List of items with format [{"item": {"id": "...", "title": "..."}, "quantity": N}]
+        currency: ISO 4217 currency code (e.g., "USD")
+        payment_handlers: List of payment handlers from discovery
+        buyer: Optional buyer information {"full_name": "...", "email": "..."}
+        request_signature: Optional request signature (JWT/signed token)
+
+    Returns:
+        Dict with checkout session details including checkout_id
+    """
+    body = _checkout_session_body(line_items, currency, payment_handlers, buyer)
+
+    return await ucp_async(
+        action="checkout_create",
+        merchant_url=merchant_url,
+        body=body,
+        request_signature=request_signature,
+    )
+
+
+@tool
+async def ucp_apply_discount_async(
+    merchant_url: str,
+    checkout_id: str,
+    discount_codes: List[str],
+    current_checkout: Dict[str, Any],
+    request_signature: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Apply discount codes to a checkout session (async).
+
+    Args:
+        merchant_url: Base URL of the UCP merchant
+        checkout_id: Checkout session ID
+        discount_codes: List of discount codes to apply (e.g., ["SAVE10"])
+        current_checkout: Current checkout session data (from previous response)
+        request_signature: Optional request signature (JWT/signed token)
+
+    Returns:
+        Dict with updated checkout including applied discounts
+    """
+    body = _apply_discount_body(checkout_id, discount_codes, current_checkout)
+
+    return await ucp_async(
+        action="checkout_update",
+        merchant_url=merchant_url,
+        checkout_id=checkout_id,
+        body=body,
+        request_signature=request_signature,
+    )
+
+
+@tool
+async def ucp_complete_checkout_async(
+    merchant_url: str,
+    checkout_id: str,
+    payment_instrument: Dict[str, Any],
+    risk_signals: Optional[Dict[str, Any]] = None,
+    request_signature: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Complete a checkout session with payment (async).
+
+    Args:
+        merchant_url: Base URL of the UCP merchant
+        checkout_id: Checkout session ID
+        payment_instrument: Payment instrument data matching handler schema
+        risk_signals: Optional risk signals (IP, browser, etc.)
+        request_signature: Optional request signature (JWT/signed token)
+
+    Returns:
+        Dict with completed order details including order_id
+    """
+    body = _complete_checkout_body(payment_instrument, risk_signals)
+
+    return await ucp_async(
+        action="checkout_complete",
+        merchant_url=merchant_url,
+        checkout_id=checkout_id,
+        body=body,
+        request_signature=request_signature,
+    )
+
+
 if __name__ == "__main__":
     # Test discovery
     print("Testing UCP tool...")
@@ -0,0 +1,381 @@
+"""Tests for strands_ucp.ucp using httpx.MockTransport instead of a live server."""
+
+import asyncio
+import importlib
+import json
+import uuid
+
+import httpx
+import pytest
+
+ucp_module = importlib.import_module("strands_ucp.ucp")
+
+MERCHANT_URL = "https://shop.example.com"
+DISCOVERY_BODY = {
+    "ucp": {"version": "2026-01-11", "capabilities": [{"name": "checkout"}]}
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_discovery_cache():
+    ucp_module._DISCOVERY_CACHE.clear()
+    yield
+    ucp_module._DISCOVERY_CACHE.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ucp_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def merchant(monkeypatch):
+    """Route the shared sync client to a MockTransport and record requests."""
+    state = {"requests": [], "status_code": 200, "headers": {}, "response": None}
+
+    def handler(request):
+        state["requests"].append(request)
+        if state["response"] is not None:
+            return state["response"]
+        return httpx.Response(
+            state["status_code"], json=DISCOVERY_BODY, headers=state["headers"]
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ucp_module, "_get_client", lambda *args: client)
+    yield state
+    client.close()
+
+
+def test_fast_uuid4_sets_version_and_variant_bits():
+    values = {ucp_module._fast_uuid4() for _ in range(2000)}
+
+    assert len(values) == 2000
+    for value in values:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
+
+def test_ucp_encodes_non_string_body_keys(merchant):
+    result = ucp_module.ucp(
+        action="checkout_create", merchant_url=MERCHANT_URL, body={"q": {1: 2}}
+    )
+
+    assert result["status"] == "success"
+    request = merchant["requests"][0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"q": {"1": 2}}
+
+
+def test_ucp_omits_request_echo_by_default(merchant):
+    result = ucp_module.ucp(action="order_list", merchant_url=MERCHANT_URL)
+
+    assert "request" not in result
+
+
+def test_ucp_request_echo_excludes_signature(merchant):
+    result = ucp_module.ucp(
+        action="checkout_create",
+        merchant_url=MERCHANT_URL,
+        body={"currency": "USD"},
+        request_signature="secret",
+        include_request_echo=True,
+    )
+
+    echo = result["request"]
+    assert echo["method"] == "POST"
+    assert echo["url"] == MERCHANT_URL + "/checkout-sessions"
+    assert echo["body"] == {"currency": "USD"}
+    assert "request-signature" not in echo["headers"]
+    assert merchant["requests"][0].headers["request-signature"] == "secret"
+
+
+@pytest.mark.parametrize(
+    ("action", "response_body", "checkout_id", "order_id"),
+    [
+        ("checkout_get", {"id": "checkout_1"}, "checkout_1", None),
+        (
+            "checkout_complete",
+            {"id": "checkout_1", "order": {"id": "order_9"}},
+            "checkout_1",
+            "order_9",
+        ),
+        ("order_get", {"id": "order_1"}, None, "order_1"),
+        ("order_get", {"id": "order_1", "order": {"id": "order_2"}}, None, "order_2"),
+        ("order_get", {"id": "order_1", "order": {"status": "open"}}, None, "order_1"),
+        ("refund_create", {"id": "refund_1"}, None, None),
+    ],
+)
+def test_ucp_extracts_checkout_and_order_ids(
+    merchant, action, response_body, checkout_id, order_id
+):
+    merchant["response"] = httpx.Response(200, json=response_body)
+
+    result = ucp_module.ucp(action=action, merchant_url=MERCHANT_URL)
+
+    assert result.get("checkout_id") == checkout_id
+    assert result.get("order_id") == order_id
+
+
+def test_ucp_extracts_ucp_metadata(merchant):
+    result = ucp_module.ucp(action="discovery", merchant_url=MERCHANT_URL)
+
+    assert result["ucp_metadata"] == DISCOVERY_BODY["ucp"]
+    assert result["capabilities"] == [{"name": "checkout"}]
+
+
+@pytest.mark.parametrize("method", ["GET", "DELETE"])
+def test_ucp_sends_no_body_for_bodyless_methods(merchant, method):
+    ucp_module.ucp(
+        action="custom",
+        merchant_url=MERCHANT_URL,
+        method=method,
+        endpoint="/orders/order_1",
+        body={"reason": "ignored"},
+    )
+
+    request = merchant["requests"][0]
+    assert request.method == method
+    assert request.content == b""
+    assert "idempotency-key" not in request.headers
+
+
+def test_ucp_sends_patch_body_with_idempotency_key(merchant):
+    ucp_module.ucp(
+        action="custom",
+        merchant_url=MERCHANT_URL,
+        method="PATCH",
+        endpoint="/orders/order_1",
+        body={"note": "gift"},
+    )
+
+    request = merchant["requests"][0]
+    assert request.method == "PATCH"
+    assert json.loads(request.content) == {"note": "gift"}
+    assert "idempotency-key" in request.headers
+
+
+def test_ucp_rejects_unsupported_method(merchant):
+    result = ucp_module.ucp(
+        action="custom", merchant_url=MERCHANT_URL, method="TRACE", endpoint="/"
+    )
+
+    assert result == {"status": "error", "message": "Unsupported HTTP method: TRACE"}
+    assert merchant["requests"] == []
+
+
+@pytest.mark.parametrize(
+    ("response", "expected_body"),
+    [
+        (httpx.Response(204), None),
+        (httpx.Response(200, headers={"Content-Type": "application/json"}), None),
+        (httpx.Response(200, text="accepted"), "accepted"),
+        (httpx.Response(200, text='{"id": "x"}'), '{"id": "x"}'),
+        (
+            httpx.Response(
+                200,
+                content=b"\xff{bad",
+                headers={"Content-Type": "application/json"},
+            ),
+            "\ufffd{bad",
+        ),
+    ],
+)
+def test_ucp_parses_empty_and_non_json_bodies(merchant, response, expected_body):
+    merchant["response"] = response
+
+    result = ucp_module.ucp(action="order_list", merchant_url=MERCHANT_URL)
+
+    assert result["body"] == expected_body
+
+
+@pytest.mark.parametrize(
+    "content_type", ["Application/JSON", "application/problem+json; charset=UTF-8"]
+)
+def test_ucp_parses_json_content_type_case_insensitively(merchant, content_type):
+    merchant["response"] = httpx.Response(
+        201,
+        content=b'{"id": "checkout_1"}',
+        headers={"Content-Type": content_type},
+    )
+
+    result = ucp_module.ucp(
+        action="checkout_create", merchant_url=MERCHANT_URL, body={}
+    )
+
+    assert result["body"] == {"id": "checkout_1"}
+    assert result["checkout_id"] == "checkout_1"
+
+
+@pytest.mark.parametrize(
+    ("merchant_url", "headers"),
+    [
+        ("http://[::1", None),
+        ("https://x\n", None),
+        (MERCHANT_URL, {"X-Name": "Çağatay"}),
+    ],
+)
+def test_ucp_reports_bad_input_as_error(merchant, merchant_url, headers):
+    result = ucp_module.ucp(
+        action="order_list", merchant_url=merchant_url, headers=headers
+    )
+
+    assert result["status"] == "error"
+    assert result["message"].startswith("Request error:")
+    assert merchant["requests"] == []
+
+
+def test_ucp_async_reports_bad_url_as_error():
+    result = asyncio.run(
+        ucp_module.ucp_async(action="order_list", merchant_url="http://[::1")
+    )
+
+    assert result["status"] == "error"
+
+
+@pytest.mark.parametrize("merchant_url", ["http://[::1", "https://x\n"])
+def test_discover_reports_bad_url_as_error(merchant, merchant_url):
+    assert ucp_module.ucp_discover(merchant_url)["status"] == "error"
+    assert asyncio.run(ucp_module.ucp_discover_async(merchant_url))["status"] == "error"
+
+
+HTTPX_DEFAULT_HEADERS = {
+    "host",
+    "accept",
+    "accept-encoding",
+    "connection",
+    "user-agent",
+}
+
+
+@pytest.mark.parametrize(
+    ("signature", "expected"),
+    [
+        (None, {"ucp-agent", "request-id"}),
+        ("sig", {"ucp-agent", "request-id", "request-signature"}),
+    ],
+)
+def test_discover_sends_minimal_headers(merchant, monkeypatch, signature, expected):
+    monkeypatch.setattr(ucp_module, "_DEFAULT_SIGNATURE", signature)
+
+    ucp_module.ucp_discover(MERCHANT_URL)
+
+    request = merchant["requests"][0]
+    assert request.method == "GET"
+    assert request.content == b""
+    assert set(request.headers.keys()) - HTTPX_DEFAULT_HEADERS == expected
+    assert request.headers["UCP-Agent"] == ucp_module._UCP_AGENT
+    assert request.headers.get("request-signature") == signature
+
+
+def test_discover_caches_successful_response(merchant, clock):
+    first = ucp_module.ucp_discover(MERCHANT_URL)
+    second = ucp_module.ucp_discover(MERCHANT_URL + "/")
+
+    assert first["status"] == "success"
+    assert second["capabilities"] == [{"name": "checkout"}]
+    assert len(merchant["requests"]) == 1
+    assert merchant["requests"][0].url == MERCHANT_URL + "/.well-known/ucp"
+
+
+def test_discover_cache_expires_after_ttl(merchant, clock, monkeypatch):
+    monkeypatch.setattr(ucp_module, "_DISCOVERY_TTL", 10.0)
+
+    ucp_module.ucp_discover(MERCHANT_URL)
+    clock.now += 9
+    ucp_module.ucp_discover(MERCHANT_URL)
+    assert len(merchant["requests"]) == 1
+
+    clock.now += 2
+    ucp_module.ucp_discover(MERCHANT_URL)
+    assert len(merchant["requests"]) == 2
+
+
+def test_discover_cache_honors_max_age(merchant, clock):
+    merchant["headers"] = {"Cache-Control": "public, max-age=5"}
+
+    ucp_module.ucp_discover(MERCHANT_URL)
+    clock.now += 6
+    ucp_module.ucp_discover(MERCHANT_URL)
+
+    assert len(merchant["requests"]) == 2
+
+
+@pytest.mark.parametrize("cache_control", ["no-store", "no-cache", "max-age=0"])
+def test_discover_cache_skips_uncacheable_responses(merchant, clock, cache_control):
+    merchant["headers"] = {"Cache-Control": cache_control}
+
+    ucp_module.ucp_discover(MERCHANT_URL)
+    ucp_module.ucp_discover(MERCHANT_URL)
+
+    assert len(merchant["requests"]) == 2
+
+
+def test_discover_cache_disabled_by_zero_ttl_despite_max_age(
+    merchant, clock, monkeypatch
+):
+    monkeypatch.setattr(ucp_module, "_DISCOVERY_TTL", 0.0)
+    merchant["headers"] = {"Cache-Control": "max-age=60"}
+
+    ucp_module.ucp_discover(MERCHANT_URL)
+    ucp_module.ucp_discover(MERCHANT_URL)
+
+    assert len(merchant["requests"]) == 2
+
+
+def test_discover_cache_skips_errors(merchant, clock):
+    merchant["status_code"] = 503
+
+    assert ucp_module.ucp_discover(MERCHANT_URL)["status"] == "error"
+    ucp_module.ucp_discover(MERCHANT_URL)
+
+    assert len(merchant["requests"]) == 2
+
+
+def test_discover_cache_returns_independent_copies(merchant, clock):
+    first = ucp_module.ucp_discover(MERCHANT_URL)
+    first["body"]["ucp"]["version"] = "MUTATED"
+    second = ucp_module.ucp_discover(MERCHANT_URL)
+    second["capabilities"].append({"name": "extra"})
+    third = ucp_module.ucp_discover(MERCHANT_URL)
+
+    assert third["body"]["ucp"]["version"] == "2026-01-11"
+    assert third["capabilities"] == [{"name": "checkout"}]
+    assert len(merchant["requests"]) == 1
+
+
+@pytest.mark.parametrize(("value", "expected"), [("42", 42.0), ("abc", 300.0)])
+def test_discovery_ttl_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("UCP_DISCOVERY_TTL", value)
+
+    assert ucp_module._discovery_ttl_from_env() == expected
+
+
+def test_async_client_reused_within_loop_and_closed_with_it():
+    async def get_clients():
+        return (
+            ucp_module._get_async_client(30, True),
+            ucp_module._get_async_client(30, True),
+            ucp_module._get_async_client(5, True),
+        )
+
+    first, again, other = asyncio.run(get_clients())
+    second, _, _ = asyncio.run(get_clients())
+
+    assert first is again
+    assert first is not other
+    assert first is not second
+    assert first.is_closed and other.is_closed and second.is_closed
+    assert ucp_module._ASYNC_CLIENTS == {}